@@ -0,0 +1,114 @@
+"""
+Measure import and service construction time for pygoogleslides.
+
+Import statements each run in a new Python process, so nothing is cached
+between runs. The "eager" row imports what `import pygoogleslides` used to
+pull in before names were loaded lazily, for comparison.
+
+Service construction is timed in a single process: repeated
+get_slides_service/get_drive_service calls against plain googleapiclient
+build() calls, to check the helpers add no overhead.
+
+Usage:
+    python benchmarks/import_time.py [--runs N] [--builds N]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+IMPORT_STATEMENTS = [
+    ('interpreter startup', 'pass'),
+    ('import pygoogleslides (lazy)', 'import pygoogleslides'),
+    ('pygoogleslides.Presentation', 'import pygoogleslides; pygoogleslides.Presentation'),
+    ('eager import (previous behavior)',
+     'import pygoogleslides.auth, googleapiclient.discovery, google.oauth2.service_account'),
+]
+
+# Runs in a fresh interpreter and prints one "label median_ms min_ms" line per row.
+BUILD_SCRIPT = '''
+import statistics, sys, time
+from google.auth.credentials import AnonymousCredentials
+from googleapiclient.discovery import build
+from pygoogleslides.auth import get_drive_service, get_slides_service
+
+creds = AnonymousCredentials()
+builds = int(sys.argv[1])
+rows = [
+    ('build(slides, v1)', lambda: build('slides', 'v1', credentials=creds)),
+    ('get_slides_service', lambda: get_slides_service(creds)),
+    ('build(drive, v3)', lambda: build('drive', 'v3', credentials=creds)),
+    ('get_drive_service', lambda: get_drive_service(creds)),
+]
+for label, func in rows:
+    times = []
+    for _ in range(builds):
+        start = time.perf_counter()
+        func()
+        times.append((time.perf_counter() - start) * 1000)
+    print(label, statistics.median(times), min(times))
+'''
+
+
+def _env():
+    return dict(os.environ, PYTHONPATH=REPO_ROOT + os.pathsep + os.environ.get('PYTHONPATH', ''))
+
+
+def _report_failure(label, result):
+    print(f"{label:34} failed:")
+    print(result.stderr.decode(errors='replace').rstrip())
+
+
+def _print_row(label, median, minimum):
+    print(f"{label:34} median {median:7.1f} ms   min {minimum:7.1f} ms")
+
+
+def time_imports(runs):
+    """Time each import statement in fresh interpreters."""
+    for label, statement in IMPORT_STATEMENTS:
+        times = []
+        for _ in range(runs):
+            start = time.perf_counter()
+            result = subprocess.run([sys.executable, '-c', statement], env=_env(), capture_output=True)
+            elapsed = (time.perf_counter() - start) * 1000
+            if result.returncode != 0:
+                _report_failure(label, result)
+                break
+            times.append(elapsed)
+        else:
+            _print_row(label, statistics.median(times), min(times))
+
+
+def time_builds(builds):
+    """Time repeated service construction with the package helpers and with build()."""
+    result = subprocess.run(
+        [sys.executable, '-c', BUILD_SCRIPT, str(builds)], env=_env(), capture_output=True
+    )
+    if result.returncode != 0:
+        _report_failure('service construction', result)
+        return
+    for line in result.stdout.decode().splitlines():
+        label, median, minimum = line.rsplit(' ', 2)
+        _print_row(label, float(median), float(minimum))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--runs', type=int, default=20, help='number of fresh interpreters per import statement')
+    parser.add_argument('--builds', type=int, default=20, help='number of service builds per row')
+    args = parser.parse_args()
+
+    print('Import time (fresh interpreter per run)')
+    time_imports(args.runs)
+    print()
+    print('Service construction (same process)')
+    time_builds(args.builds)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,23 +1,37 @@
 """
 PyGoogleSlides - A Python package for automating Google Slides presentations.
+
+Public names are loaded lazily on first access, so importing the package does
+not import the Google client libraries until they are actually needed.
 """
 
-from .auth import get_credentials, get_drive_service, get_slides_service
-from .drive import (
-    find_folder, 
-    create_folder, 
-    find_file, 
-    delete_file, 
-    rename_file, 
-    copy_presentation, 
-    move_file,
-    find_or_create_folder
-)
-from .presentation import Presentation
+import importlib
 
 __version__ = "0.1.0"
 __author__ = "Vishnu Bashyam"
 
+# Maps each public name to the submodule that defines it.
+_LAZY_ATTRIBUTES = {
+    'get_credentials': '.auth',
+    'get_drive_service': '.auth',
+    'get_slides_service': '.auth',
+    'find_folder': '.drive',
+    'create_folder': '.drive',
+    'find_file': '.drive',
+    'delete_file': '.drive',
+    'rename_file': '.drive',
+    'copy_presentation': '.drive',
+    'move_file': '.drive',
+    'find_or_create_folder': '.drive',
+    'sync_folder_tree': '.drive',
+    'Presentation': '.presentation',
+    'RequestPlan': '.plan',
+    'summarize_snapshot': '.plan',
+}
+
+# Submodules that can be accessed as attributes, e.g. pygoogleslides.drive.move_file
+_SUBMODULES = ('auth', 'drive', 'presentation', 'plan')
+
 __all__ = [
     'get_credentials',
     'get_drive_service',
@@ -30,5 +44,25 @@ __all__ = [
     'copy_presentation',
     'move_file',
     'find_or_create_folder',
+    'sync_folder_tree',
     'Presentation',
-]
\ No newline at end of file
+    'RequestPlan',
+    'summarize_snapshot',
+]
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        # Importing a submodule also binds it as an attribute of this package
+        return importlib.import_module('.' + name, __name__)
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    # Cache on the module so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__) | set(_SUBMODULES))
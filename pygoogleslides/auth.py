@@ -1,22 +1,34 @@
-from google.oauth2 import service_account
-from googleapiclient.discovery import build
-
 DEFAULT_SCOPES = [
     'https://www.googleapis.com/auth/drive',
     'https://www.googleapis.com/auth/presentations'
 ]
 
+# The Google client libraries are imported inside the functions below so that
+# importing pygoogleslides stays cheap for short-lived processes.
+
+
 def get_credentials(service_account_file, scopes=None):
     """Return credentials using a service account key file."""
+    from google.oauth2 import service_account
+
     if scopes is None:
         scopes = DEFAULT_SCOPES
     creds = service_account.Credentials.from_service_account_file(service_account_file, scopes=scopes)
     return creds
 
+
+def _build_service(service_name, version, creds):
+    """Build a service from the discovery document bundled with google-api-python-client."""
+    from googleapiclient.discovery import build
+
+    return build(service_name, version, credentials=creds, static_discovery=True)
+
+
 def get_slides_service(creds):
     """Return the Google Slides API service."""
-    return build('slides', 'v1', credentials=creds)
+    return _build_service('slides', 'v1', creds)
+
 
 def get_drive_service(creds):
     """Return the Google Drive API service."""
-    return build('drive', 'v3', credentials=creds) 
\ No newline at end of file
+    return _build_service('drive', 'v3', creds)
@@ -243,4 +243,196 @@ def find_or_create_folder(drive_service, folder_name, parent_folder_id=None):
             except Exception as e:
                 print(f"Could not delete folder {folder['name']} (ID: {source_folder_id}): {str(e)}")
         
-        return drive_service.files().get(fileId=target_folder_id, fields='id,name').execute() 
\ No newline at end of file
+        return drive_service.files().get(fileId=target_folder_id, fields='id,name').execute() 
+
+_FOLDER_MIME_TYPE = 'application/vnd.google-apps.folder'
+
+# Keep "'a' in parents or 'b' in parents ..." queries well under Drive's query length limit.
+_MAX_PARENTS_PER_QUERY = 50
+
+# Drive accepts at most 100 calls in a single batch HTTP request.
+_MAX_BATCH_SIZE = 100
+
+
+def _normalize_folder_paths(tree, prefix=()):
+    """Return the set of path tuples (including every intermediate folder) described by tree."""
+    paths = set()
+    if isinstance(tree, dict):
+        for name, subtree in tree.items():
+            path = prefix + (name,)
+            paths.add(path)
+            if subtree:
+                paths.update(_normalize_folder_paths(subtree, path))
+        return paths
+
+    for entry in tree:
+        parts = entry.split('/') if isinstance(entry, str) else entry
+        parts = tuple(part for part in parts if part)
+        for depth in range(1, len(parts) + 1):
+            paths.add(prefix + parts[:depth])
+    return paths
+
+
+def _list_children(drive_service, parent_ids, folders_only=False):
+    """List the non-trashed children of many parents with paginated "in parents" queries."""
+    parent_ids = list(parent_ids)
+    children = []
+    for start in range(0, len(parent_ids), _MAX_PARENTS_PER_QUERY):
+        chunk = parent_ids[start:start + _MAX_PARENTS_PER_QUERY]
+        query = '(' + ' or '.join(f"'{parent_id}' in parents" for parent_id in chunk) + ') and trashed=false'
+        if folders_only:
+            query = f"mimeType='{_FOLDER_MIME_TYPE}' and " + query
+
+        page_token = None
+        while True:
+            results = drive_service.files().list(
+                q=query,
+                spaces='drive',
+                fields='nextPageToken, files(id, name, parents, createdTime)',
+                pageSize=1000,
+                pageToken=page_token
+            ).execute()
+            children.extend(results.get('files', []))
+            page_token = results.get('nextPageToken')
+            if not page_token:
+                break
+    return children
+
+
+def _execute_batch(drive_service, requests):
+    """Execute Drive API requests in batch HTTP calls and return (response, exception) pairs in order."""
+    results = [None] * len(requests)
+
+    def callback(request_id, response, exception):
+        results[int(request_id)] = (response, exception)
+
+    for start in range(0, len(requests), _MAX_BATCH_SIZE):
+        batch = drive_service.new_batch_http_request(callback=callback)
+        for offset, request in enumerate(requests[start:start + _MAX_BATCH_SIZE]):
+            batch.add(request, request_id=str(start + offset))
+        batch.execute()
+    return results
+
+
+def sync_folder_tree(drive_service, tree, root_folder_id=None):
+    """
+    Make sure a whole tree of folders exists, creating missing folders and
+    consolidating duplicates, and return the ID of every folder in the tree.
+
+    The existing tree is crawled once, one level at a time, with a query over
+    all parents of that level. Missing folders are then created and duplicate
+    folders merged using batch requests, so the number of round-trips depends
+    on the depth of the tree rather than on the number of paths.
+
+    Args:
+        drive_service: Google Drive API service instance
+        tree: Either a list of '/'-separated paths (e.g. 'Client/2024/01') or a
+            nested dictionary of folder names (e.g. {'Client': {'2024': {'01': {}}}})
+        root_folder_id: ID of the folder the tree is rooted in (optional, defaults to My Drive).
+            Aliases such as 'root' are accepted; the ID is always resolved to its
+            canonical form with one files().get call before crawling.
+
+    Returns:
+        Dictionary mapping each '/'-separated path in the tree to its folder ID
+    """
+    paths = _normalize_folder_paths(tree)
+    if not paths:
+        return {}
+
+    # Resolve aliases such as 'root' to the canonical ID, since listed files report it in 'parents'
+    root_folder_id = drive_service.files().get(
+        fileId=root_folder_id if root_folder_id is not None else 'root',
+        fields='id'
+    ).execute()['id']
+
+    # Map each path to its existing folder IDs; the first ID is the one that is kept
+    folders = {(): [root_folder_id]}
+    max_depth = max(len(path) for path in paths)
+
+    for depth in range(1, max_depth + 1):
+        level = {path for path in paths if len(path) == depth}
+        parent_to_path = {}
+        for path in level:
+            for parent_id in folders.get(path[:-1], []):
+                parent_to_path[parent_id] = path[:-1]
+        if not parent_to_path:
+            continue
+
+        found = {}
+        for child in _list_children(drive_service, parent_to_path, folders_only=True):
+            for parent_id in child.get('parents', []):
+                parent_path = parent_to_path.get(parent_id)
+                if parent_path is None or parent_path + (child['name'],) not in level:
+                    continue
+                # Prefer a folder already under the kept parent, then the oldest one.
+                # A folder with several matching parents is seen once per parent, so
+                # only its best ranking is kept.
+                rank = (parent_id != folders[parent_path][0], child.get('createdTime', ''))
+                candidates = found.setdefault(parent_path + (child['name'],), {})
+                if child['id'] not in candidates or rank < candidates[child['id']]:
+                    candidates[child['id']] = rank
+        for path, candidates in found.items():
+            folders[path] = sorted(candidates, key=lambda folder_id: (candidates[folder_id], folder_id))
+
+    # Merge duplicates: move their contents into the kept folder, then delete them.
+    # A folder kept for any path is never treated as a duplicate.
+    kept_ids = {folder_ids[0] for folder_ids in folders.values()}
+    duplicate_to_kept = {}
+    for path, folder_ids in folders.items():
+        duplicate_ids = [folder_id for folder_id in folder_ids[1:] if folder_id not in kept_ids]
+        if duplicate_ids:
+            print(f"Found {len(duplicate_ids) + 1} folders named '{'/'.join(path)}'. Consolidating...")
+            for duplicate_id in duplicate_ids:
+                duplicate_to_kept[duplicate_id] = folder_ids[0]
+
+    if duplicate_to_kept:
+        moves = []
+        for item in _list_children(drive_service, duplicate_to_kept):
+            for parent_id in item.get('parents', []):
+                if parent_id in duplicate_to_kept:
+                    moves.append((parent_id, drive_service.files().update(
+                        fileId=item['id'],
+                        addParents=duplicate_to_kept[parent_id],
+                        removeParents=parent_id,
+                        fields='id'
+                    )))
+
+        failed = set()
+        move_results = _execute_batch(drive_service, [request for _, request in moves])
+        for (source_id, _), (_, exception) in zip(moves, move_results):
+            if exception is not None:
+                print(f"Could not move a file out of folder {source_id}: {str(exception)}")
+                failed.add(source_id)
+
+        # Only delete duplicates that were emptied completely
+        to_delete = [folder_id for folder_id in duplicate_to_kept if folder_id not in failed]
+        delete_results = _execute_batch(
+            drive_service,
+            [drive_service.files().delete(fileId=folder_id) for folder_id in to_delete]
+        )
+        for folder_id, (_, exception) in zip(to_delete, delete_results):
+            if exception is not None:
+                print(f"Could not delete folder {folder_id}: {str(exception)}")
+
+    # Create missing folders level by level so parents exist before their children
+    for depth in range(1, max_depth + 1):
+        missing = sorted(path for path in paths if len(path) == depth and path not in folders)
+        if not missing:
+            continue
+        create_requests = [
+            drive_service.files().create(
+                body={
+                    'name': path[-1],
+                    'mimeType': _FOLDER_MIME_TYPE,
+                    'parents': [folders[path[:-1]][0]]
+                },
+                fields='id,name'
+            )
+            for path in missing
+        ]
+        for path, (response, exception) in zip(missing, _execute_batch(drive_service, create_requests)):
+            if exception is not None:
+                raise exception
+            folders[path] = [response['id']]
+
+    return {'/'.join(path): folders[path][0] for path in sorted(paths)}
@@ -0,0 +1,313 @@
+import json
+
+from .presentation import _TextElement, _extract_text_elements, _to_api
+
+# Upper bound on the number of requests replayed in a single batchUpdate call.
+MAX_PLAN_REQUESTS = 500
+
+_RANGE_REQUEST_TYPES = ('updateTextStyle', 'updateParagraphStyle', 'createParagraphBullets')
+
+
+def _collect_element_ids(page_elements, ids):
+    """Add the object IDs of page elements, including those nested in groups, to ids."""
+    for element in page_elements:
+        ids.append(element['objectId'])
+        if 'elementGroup' in element:
+            _collect_element_ids(element['elementGroup'].get('children', []), ids)
+
+
+def summarize_snapshot(presentation):
+    """
+    Reduce a presentation's full JSON to what a request plan needs for validation.
+
+    Args:
+        presentation: Presentation JSON as returned by Presentation.fetch()
+
+    Returns:
+        Dictionary with the presentation and revision IDs, each slide's object ID, page
+        element IDs and speaker notes page, the IDs of layouts and masters, and the text
+        of every text shape
+    """
+    slides = []
+    for slide in presentation.get('slides', []):
+        element_ids = []
+        _collect_element_ids(slide.get('pageElements', []), element_ids)
+        summary = {'objectId': slide['objectId'], 'pageElementIds': element_ids}
+        if 'slideProperties' in slide and 'notesPage' in slide['slideProperties']:
+            notes_page = slide['slideProperties']['notesPage']
+            notes_element_ids = []
+            _collect_element_ids(notes_page.get('pageElements', []), notes_element_ids)
+            summary['notesPageId'] = notes_page.get('objectId')
+            summary['notesElementIds'] = notes_element_ids
+        slides.append(summary)
+
+    return {
+        'presentationId': presentation.get('presentationId'),
+        'revisionId': presentation.get('revisionId'),
+        'slides': slides,
+        'layoutAndMasterIds': [
+            page['objectId'] for page in presentation.get('layouts', []) + presentation.get('masters', [])
+        ],
+        'textElements': [[element.object_id, element.text] for element in _extract_text_elements(presentation)],
+    }
+
+
+class _PlanState:
+    """Local simulation of a presentation's pages, element IDs and text while a plan is applied."""
+    __slots__ = ('slide_ids', 'element_ids', 'page_elements', 'notes_page_ids', 'texts')
+
+    def __init__(self, snapshot):
+        self.slide_ids = [slide['objectId'] for slide in snapshot['slides']]
+        # Slide ID -> IDs of every element on the slide and its speaker notes page
+        self.element_ids = {}
+        # Page ID (slide, notes page, layout or master) -> IDs of the elements on that page
+        self.page_elements = {page_id: set() for page_id in snapshot.get('layoutAndMasterIds', [])}
+        # Slide ID -> ID of its speaker notes page
+        self.notes_page_ids = {}
+        for slide in snapshot['slides']:
+            slide_id = slide['objectId']
+            notes_element_ids = set(slide.get('notesElementIds', []))
+            self.page_elements[slide_id] = set(slide['pageElementIds'])
+            self.element_ids[slide_id] = self.page_elements[slide_id] | notes_element_ids
+            if slide.get('notesPageId') is not None:
+                self.notes_page_ids[slide_id] = slide['notesPageId']
+                self.page_elements[slide['notesPageId']] = notes_element_ids
+        self.texts = {object_id: text for object_id, text in snapshot['textElements']}
+
+    def _slide_of(self, object_id):
+        for slide_id, element_ids in self.element_ids.items():
+            if object_id in element_ids:
+                return slide_id
+        return None
+
+    def _exists(self, object_id):
+        return object_id in self.page_elements or self._slide_of(object_id) is not None
+
+    def _remove_element(self, object_id):
+        slide_id = self._slide_of(object_id)
+        if slide_id is not None:
+            self.element_ids[slide_id].discard(object_id)
+        for element_ids in self.page_elements.values():
+            element_ids.discard(object_id)
+        self.texts.pop(object_id, None)
+
+    def _remove_slide(self, slide_id):
+        for element_id in self.element_ids.pop(slide_id):
+            self.texts.pop(element_id, None)
+        self.page_elements.pop(slide_id, None)
+        self.page_elements.pop(self.notes_page_ids.pop(slide_id, None), None)
+        self.slide_ids.remove(slide_id)
+
+    def _text_ids_on(self, page_object_ids):
+        if not page_object_ids:
+            return list(self.texts)
+        element_ids = set()
+        for page_id in page_object_ids:
+            element_ids.update(self.page_elements.get(page_id, ()))
+        return [object_id for object_id in self.texts if object_id in element_ids]
+
+    def apply(self, request):
+        """Apply one request (API JSON) to the simulated state and return a list of problems."""
+        problems = []
+        kind = next(iter(request), None)
+        body = request.get(kind, {})
+
+        if kind in ('replaceAllText', 'replaceAllShapesWithImage'):
+            for page_id in body.get('pageObjectIds') or []:
+                if page_id not in self.page_elements:
+                    problems.append(f"pageObjectId '{page_id}' does not exist")
+
+        if kind == 'replaceAllText':
+            text = body.get('containsText', {}).get('text')
+            if not text:
+                problems.append('containsText.text is empty')
+            else:
+                for object_id in self._text_ids_on(body.get('pageObjectIds')):
+                    self.texts[object_id] = self.texts[object_id].replace(text, body.get('replaceText', ''))
+
+        elif kind in _RANGE_REQUEST_TYPES:
+            object_id = body.get('objectId')
+            text_range = body.get('textRange', {})
+            if object_id not in self.texts:
+                problems.append(f"objectId '{object_id}' is not a text shape in the snapshot")
+            elif text_range.get('type') == 'FIXED_RANGE':
+                start = text_range.get('startIndex', 0)
+                end = text_range.get('endIndex', 0)
+                length = len(self.texts[object_id])
+                if not 0 <= start < end <= length:
+                    problems.append(
+                        f"text range [{start}, {end}) is out of bounds for '{object_id}' (length {length})"
+                    )
+
+        elif kind == 'replaceAllShapesWithImage':
+            text = body.get('containsText', {}).get('text')
+            if not text:
+                problems.append('containsText.text is empty')
+            if not body.get('imageUrl'):
+                problems.append('imageUrl is empty')
+            if text:
+                # Matching shapes are replaced by new images with new object IDs
+                for object_id in self._text_ids_on(body.get('pageObjectIds')):
+                    if text in self.texts[object_id]:
+                        self._remove_element(object_id)
+
+        elif kind == 'createSlide':
+            insertion_index = body.get('insertionIndex', len(self.slide_ids))
+            object_id = body.get('objectId')
+            if not 0 <= insertion_index <= len(self.slide_ids):
+                problems.append(
+                    f"insertionIndex {insertion_index} is out of bounds for {len(self.slide_ids)} slides"
+                )
+                insertion_index = len(self.slide_ids)
+            if object_id is not None and self._exists(object_id):
+                problems.append(f"objectId '{object_id}' is already in use")
+            else:
+                self.slide_ids.insert(insertion_index, object_id)
+                if object_id is not None:
+                    self.element_ids[object_id] = set()
+                    self.page_elements[object_id] = set()
+
+        elif kind == 'deleteObject':
+            object_id = body.get('objectId')
+            if object_id in self.element_ids:
+                self._remove_slide(object_id)
+            elif self._slide_of(object_id) is not None:
+                self._remove_element(object_id)
+            else:
+                problems.append(f"objectId '{object_id}' does not exist")
+
+        return problems
+
+
+class RequestPlan:
+    """
+    A serializable list of batchUpdate requests recorded by a Presentation in plan mode.
+
+    The plan keeps a compact snapshot of the presentation it was recorded against, so it
+    can be validated locally and replayed later against any copy of that presentation.
+    """
+
+    def __init__(self, requests=None, snapshot=None, max_requests=MAX_PLAN_REQUESTS):
+        """
+        Args:
+            requests (list, optional): Requests to start the plan with. Defaults to None.
+            snapshot (dict, optional): Snapshot from summarize_snapshot(). Defaults to None.
+            max_requests (int, optional): Maximum number of requests in the plan.
+                Defaults to MAX_PLAN_REQUESTS.
+        """
+        self.requests = []
+        self.snapshot = snapshot
+        self.max_requests = max_requests
+        self._state = _PlanState(snapshot) if snapshot is not None else None
+        if requests:
+            self.add(requests)
+
+    def __len__(self):
+        return len(self.requests)
+
+    def add(self, requests):
+        """Append requests (request dicts or pending request records) to the plan."""
+        for request in requests:
+            self.requests.append(request)
+            if self._state is not None:
+                self._state.apply(_to_api(request))
+
+    def text_elements(self):
+        """Return the text shapes of the snapshot as they would be after the planned requests."""
+        if self._state is None:
+            raise ValueError("This plan has no snapshot to read text from.")
+        return [_TextElement(object_id, text) for object_id, text in self._state.texts.items()]
+
+    def problems(self, presentation=None):
+        """
+        Check the plan locally and return a list of problems (empty if the plan is valid).
+
+        Checks that the plan stays within max_requests, that referenced objectIds exist,
+        that text ranges and slide insertion indexes are in bounds, and that required
+        fields are present, simulating each request in order.
+
+        Args:
+            presentation (dict, optional): Presentation JSON to check against instead of
+                the plan's own snapshot. Defaults to None.
+        """
+        snapshot = summarize_snapshot(presentation) if presentation is not None else self.snapshot
+        if snapshot is None:
+            raise ValueError("This plan has no snapshot to validate against.")
+
+        problems = []
+        if len(self.requests) > self.max_requests:
+            problems.append(f"Plan has {len(self.requests)} requests, more than the limit of {self.max_requests}")
+
+        state = _PlanState(snapshot)
+        for i, request in enumerate(self.requests):
+            request = _to_api(request)
+            kind = next(iter(request), None)
+            for problem in state.apply(request):
+                problems.append(f"Request {i} ({kind}): {problem}")
+        return problems
+
+    def validate(self, presentation=None):
+        """Raise ValueError listing every problem found by problems()."""
+        problems = self.problems(presentation)
+        if problems:
+            raise ValueError("Invalid request plan:\n" + "\n".join(problems))
+
+    def to_dict(self):
+        """Return the plan as a JSON-serializable dictionary."""
+        return {
+            'requests': [_to_api(request) for request in self.requests],
+            'snapshot': self.snapshot,
+            'maxRequests': self.max_requests,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """Create a plan from a dictionary produced by to_dict()."""
+        return cls(
+            requests=data.get('requests', []),
+            snapshot=data.get('snapshot'),
+            max_requests=data.get('maxRequests', MAX_PLAN_REQUESTS)
+        )
+
+    def to_json(self, **kwargs):
+        """Return the plan serialized as a JSON string."""
+        return json.dumps(self.to_dict(), **kwargs)
+
+    @classmethod
+    def from_json(cls, data):
+        """Create a plan from a JSON string produced by to_json()."""
+        return cls.from_dict(json.loads(data))
+
+    def replay(self, slides_service, presentation_ids, validate=True):
+        """
+        Send the planned requests as one batchUpdate to each presentation.
+
+        Object IDs are preserved when a presentation is copied, so a plan recorded
+        against a template can be replayed against any number of copies of it.
+
+        Args:
+            slides_service: Google Slides API service instance
+            presentation_ids: ID or iterable of IDs of presentations to update
+            validate (bool, optional): Whether to validate the plan against its snapshot
+                first. Defaults to True.
+
+        Returns:
+            List of batchUpdate responses, one per presentation
+        """
+        if validate and self.snapshot is not None:
+            self.validate()
+        elif len(self.requests) > self.max_requests:
+            raise ValueError(f"Plan has {len(self.requests)} requests, more than the limit of {self.max_requests}")
+
+        presentation_ids = [presentation_ids] if isinstance(presentation_ids, str) else list(presentation_ids)
+        if not self.requests:
+            return [None for _ in presentation_ids]
+
+        body = {'requests': [_to_api(request) for request in self.requests]}
+        return [
+            slides_service.presentations().batchUpdate(
+                presentationId=presentation_id,
+                body=body
+            ).execute()
+            for presentation_id in presentation_ids
+        ]
@@ -1,7 +1,157 @@
+# Fields mask used when only the text of page elements is needed. Requesting
+# just object IDs and text run content keeps the fetched payload small.
+_TEXT_ELEMENT_FIELDS = (
+    'slides(pageElements(objectId,shape/text/textElements/textRun/content),'
+    'slideProperties/notesPage/pageElements(objectId,shape/text/textElements/textRun/content))'
+)
+
+_BULLET_PRESETS = {
+    'numbered': 'NUMBERED_DIGIT_ALPHA_ROMAN',
+    'bullet': 'BULLET_DISC_CIRCLE_SQUARE',
+}
+
+
+def _fixed_range(start, end):
+    return {'type': 'FIXED_RANGE', 'startIndex': start, 'endIndex': end}
+
+
+class _TextElement:
+    """Object ID and flattened text of a page element that holds text."""
+    __slots__ = ('object_id', 'text')
+
+    def __init__(self, object_id, text):
+        self.object_id = object_id
+        self.text = text
+
+
+class _Request:
+    """Base for pending requests, converted to API JSON only when sent."""
+    __slots__ = ()
+
+    def to_dict(self):
+        raise NotImplementedError
+
+
+class _ReplaceAllText(_Request):
+    __slots__ = ('text', 'replacement')
+
+    def __init__(self, text, replacement):
+        self.text = text
+        self.replacement = replacement
+
+    def to_dict(self):
+        return {
+            'replaceAllText': {
+                'containsText': {
+                    'text': self.text,
+                    'matchCase': True
+                },
+                'replaceText': self.replacement
+            }
+        }
+
+
+class _UpdateTextStyle(_Request):
+    __slots__ = ('object_id', 'start', 'end', 'bold', 'link', 'font_size')
+
+    def __init__(self, object_id, start, end, bold=False, link=None, font_size=None):
+        self.object_id = object_id
+        self.start = start
+        self.end = end
+        self.bold = bold
+        self.link = link
+        self.font_size = font_size
+
+    def to_dict(self):
+        style = {}
+        fields = []
+        if self.bold:
+            style['bold'] = True
+            fields.append('bold')
+        if self.link is not None:
+            style['link'] = {'url': self.link}
+            fields.append('link')
+        if self.font_size is not None:
+            style['fontSize'] = {'magnitude': self.font_size, 'unit': 'PT'}
+            fields.append('fontSize')
+        return {
+            'updateTextStyle': {
+                'objectId': self.object_id,
+                'textRange': _fixed_range(self.start, self.end),
+                'style': style,
+                'fields': ','.join(fields)
+            }
+        }
+
+
+class _UpdateParagraphStyle(_Request):
+    __slots__ = ('object_id', 'start', 'end', 'space_above')
+
+    def __init__(self, object_id, start, end, space_above):
+        self.object_id = object_id
+        self.start = start
+        self.end = end
+        self.space_above = space_above
+
+    def to_dict(self):
+        return {
+            'updateParagraphStyle': {
+                'objectId': self.object_id,
+                'textRange': _fixed_range(self.start, self.end),
+                'style': {
+                    'spaceAbove': {'magnitude': self.space_above, 'unit': 'PT'}
+                },
+                'fields': 'spaceAbove'
+            }
+        }
+
+
+class _CreateParagraphBullets(_Request):
+    __slots__ = ('object_id', 'start', 'end', 'preset')
+
+    def __init__(self, object_id, start, end, preset):
+        self.object_id = object_id
+        self.start = start
+        self.end = end
+        self.preset = preset
+
+    def to_dict(self):
+        return {
+            'createParagraphBullets': {
+                'objectId': self.object_id,
+                'textRange': _fixed_range(self.start, self.end),
+                'bulletPreset': self.preset
+            }
+        }
+
+
+def _to_api(request):
+    """Return the API JSON for a pending request record or a plain request dict."""
+    return request.to_dict() if isinstance(request, _Request) else request
+
+
+def _extract_text_elements(presentation):
+    """Return _TextElement records for every text shape on slides and speaker notes."""
+    elements = []
+    for slide in presentation.get('slides', []):
+        pages = [slide]
+        if 'slideProperties' in slide and 'notesPage' in slide['slideProperties']:
+            pages.append(slide['slideProperties']['notesPage'])
+        for page in pages:
+            for element in page.get('pageElements', []):
+                if 'shape' in element and 'text' in element['shape']:
+                    text_content = element['shape']['text'].get('textElements', [])
+                    full_text = ''.join([te.get('textRun', {}).get('content', '') for te in text_content])
+                    elements.append(_TextElement(element['objectId'], full_text))
+    return elements
+
+
 class Presentation:
     def __init__(self, slides_service, presentation_id):
         self.slides_service = slides_service
         self.presentation_id = presentation_id
+        # RequestPlan being recorded while in plan mode, None otherwise
+        self.plan = None
 
     def fetch(self):
         """Fetch and return the presentation's full JSON structure."""
@@ -9,181 +159,123 @@ class Presentation:
             presentationId=self.presentation_id
         ).execute()
 
+    def _fetch_text_elements(self):
+        """Fetch only the text of slide and speaker-notes shapes as _TextElement records."""
+        presentation = self.slides_service.presentations().get(
+            presentationId=self.presentation_id,
+            fields=_TEXT_ELEMENT_FIELDS
+        ).execute()
+        return _extract_text_elements(presentation)
+
+    def start_plan(self, presentation=None, max_requests=None):
+        """
+        Enter plan mode. Until finish_plan() is called, replace_text, replace_image,
+        create_slide and delete_slide record their requests in a RequestPlan instead
+        of calling the API, and replace_text reads text from a cached snapshot.
+
+        Args:
+            presentation (dict, optional): Presentation JSON to use as the snapshot.
+                Defaults to None, in which case the presentation is fetched once.
+            max_requests (int, optional): Maximum number of requests in the plan.
+                Defaults to None (plan.MAX_PLAN_REQUESTS).
+
+        Returns:
+            The RequestPlan being recorded
+        """
+        from .plan import MAX_PLAN_REQUESTS, RequestPlan, summarize_snapshot
+
+        if self.plan is not None:
+            raise ValueError("Presentation is already in plan mode.")
+        if presentation is None:
+            presentation = self.fetch()
+        self.plan = RequestPlan(
+            snapshot=summarize_snapshot(presentation),
+            max_requests=max_requests if max_requests is not None else MAX_PLAN_REQUESTS
+        )
+        return self.plan
+
+    def finish_plan(self, validate=True):
+        """
+        Leave plan mode and return the recorded RequestPlan.
+
+        Args:
+            validate (bool, optional): Whether to validate the plan against its snapshot,
+                raising ValueError if it has problems. Defaults to True.
+        """
+        if self.plan is None:
+            raise ValueError("Presentation is not in plan mode.")
+        plan, self.plan = self.plan, None
+        if validate:
+            plan.validate()
+        return plan
+
     def batch_update(self, requests):
-        """Execute a batchUpdate request on the presentation."""
-        body = {'requests': requests}
+        """Execute a batchUpdate request on the presentation, or record it when in plan mode.
+
+        Requests may be plain request dicts or pending request records; records
+        are serialized to the API's JSON shape here.
+        """
+        if self.plan is not None:
+            self.plan.add(requests)
+            return None
+        body = {'requests': [_to_api(request) for request in requests]}
         return self.slides_service.presentations().batchUpdate(
             presentationId=self.presentation_id,
             body=body
         ).execute()
 
     def _build_requests_for_element(self, element, placeholder, replacement, hyperlink, is_notes=False, option_title=None, font_size=None, spacing_after=None):
-        """Build batchUpdate requests for a given page element if it contains the placeholder."""
+        """Build pending requests for a given _TextElement if it contains the placeholder."""
         requests = []
-        if 'shape' in element and 'text' in element['shape']:
-            object_id = element['objectId']
-            text_content = element['shape']['text'].get('textElements', [])
-            full_text = ''.join([te.get('textRun', {}).get('content', '') for te in text_content])
-            
-            index = full_text.find(placeholder)
-            if option_title and replacement.strip():
-                # Detect list formatting info from the original replacement text
-                body_list_info = self._detect_list_format_info(replacement)
-                # Format lists (e.g., remove numbering or bullet markers)
-                formatted_body = self._format_lists(replacement)
-                # Process bold formatting markers in the formatted text
-                final_body, bold_ranges_body = self._process_bold_formatting(formatted_body)
-                combined_text = option_title + "\n" + final_body
-            else:
-                list_info = self._detect_list_format_info(replacement)
-                formatted_text = self._format_lists(replacement)
-                final_text, bold_ranges = self._process_bold_formatting(formatted_text)
-                combined_text = final_text
-
-            if placeholder in full_text:
-                if hyperlink:
-                    requests.append({
-                        'replaceAllText': {
-                            'containsText': {
-                                'text': placeholder,
-                                'matchCase': True
-                            },
-                            'replaceText': combined_text
-                        }
-                    })
-                    if index != -1:
-                        style_request = {
-                            'updateTextStyle': {
-                                'objectId': object_id,
-                                'textRange': {
-                                    'type': 'FIXED_RANGE',
-                                    'startIndex': index,
-                                    'endIndex': index + len(combined_text)
-                                },
-                                'style': {
-                                    'link': {
-                                        'url': hyperlink
-                                    }
-                                },
-                                'fields': 'link'
-                            }
-                        }
-                        if font_size is not None:
-                            style_request['updateTextStyle']['style']['fontSize'] = {'magnitude': font_size, 'unit': 'PT'}
-                            style_request['updateTextStyle']['fields'] += ',fontSize'
-                        requests.append(style_request)
-                else:
-                    requests.append({
-                        'replaceAllText': {
-                            'containsText': {
-                                'text': placeholder,
-                                'matchCase': True
-                            },
-                            'replaceText': combined_text
-                        }
-                    })
-                    if font_size is not None:
-                        requests.append({
-                            'updateTextStyle': {
-                                'objectId': object_id,
-                                'textRange': {
-                                    'type': 'FIXED_RANGE',
-                                    'startIndex': index,
-                                    'endIndex': index + len(combined_text)
-                                },
-                                'style': {
-                                    'fontSize': {'magnitude': font_size, 'unit': 'PT'}
-                                },
-                                'fields': 'fontSize'
-                            }
-                        })
-
-                if spacing_after is not None:
-                    requests.append({
-                        'updateParagraphStyle': {
-                            'objectId': object_id,
-                            'textRange': {
-                                'type': 'FIXED_RANGE',
-                                'startIndex': index,
-                                'endIndex': index + len(combined_text)
-                            },
-                            'style': {
-                                'spaceAbove': {'magnitude': spacing_after, 'unit': 'PT'}
-                            },
-                            'fields': 'spaceAbove'
-                        }
-                    })
-
-            if index != -1:
-                if option_title and replacement.strip():
-                    # Bold the option title (first line)
-                    style_request = {
-                        'updateTextStyle': {
-                            'objectId': object_id,
-                            'textRange': {
-                                'type': 'FIXED_RANGE',
-                                'startIndex': index,
-                                'endIndex': index + len(option_title)
-                            },
-                            'style': {
-                                'bold': True
-                            },
-                            'fields': 'bold'
-                        }
-                    }
-                    if font_size is not None:
-                        style_request['updateTextStyle']['style']['fontSize'] = {'magnitude': font_size, 'unit': 'PT'}
-                        style_request['updateTextStyle']['fields'] += ',fontSize'
-                    requests.append(style_request)
-
-                    # Apply bold styling for words marked with ** in the body
-                    body_start_index = index + len(option_title) + 1
-                    for r_start, r_end in bold_ranges_body:
-                        style_request = {
-                            'updateTextStyle': {
-                                'objectId': object_id,
-                                'textRange': {
-                                    'type': 'FIXED_RANGE',
-                                    'startIndex': body_start_index + r_start,
-                                    'endIndex': body_start_index + r_end
-                                },
-                                'style': {
-                                    'bold': True
-                                },
-                                'fields': 'bold'
-                            }
-                        }
-                        if font_size is not None:
-                            style_request['updateTextStyle']['style']['fontSize'] = {'magnitude': font_size, 'unit': 'PT'}
-                            style_request['updateTextStyle']['fields'] += ',fontSize'
-                        requests.append(style_request)
-
-                    # Apply list styling to the body (after title and newline)
-                    requests.extend(self._create_list_style_requests(object_id, final_body, body_list_info, body_start_index))
-                else:
-                    # Apply bold styling for words marked with ** in the entire replacement text
-                    for r_start, r_end in bold_ranges:
-                        style_request = {
-                            'updateTextStyle': {
-                                'objectId': object_id,
-                                'textRange': {
-                                    'type': 'FIXED_RANGE',
-                                    'startIndex': index + r_start,
-                                    'endIndex': index + r_end
-                                },
-                                'style': {
-                                    'bold': True
-                                },
-                                'fields': 'bold'
-                            }
-                        }
-                        if font_size is not None:
-                            style_request['updateTextStyle']['style']['fontSize'] = {'magnitude': font_size, 'unit': 'PT'}
-                            style_request['updateTextStyle']['fields'] += ',fontSize'
-                        requests.append(style_request)
-
-                    # Apply list styling to the entire replacement text
-                    requests.extend(self._create_list_style_requests(object_id, final_text, list_info, index))
+        object_id = element.object_id
+        index = element.text.find(placeholder)
+        if index == -1:
+            return requests
+
+        if option_title and replacement.strip():
+            # Detect list formatting info from the original replacement text
+            body_list_info = self._detect_list_format_info(replacement)
+            # Format lists (e.g., remove numbering or bullet markers)
+            formatted_body = self._format_lists(replacement)
+            # Process bold formatting markers in the formatted text
+            final_body, bold_ranges_body = self._process_bold_formatting(formatted_body)
+            combined_text = option_title + "\n" + final_body
+        else:
+            list_info = self._detect_list_format_info(replacement)
+            formatted_text = self._format_lists(replacement)
+            final_text, bold_ranges = self._process_bold_formatting(formatted_text)
+            combined_text = final_text
+        combined_end = index + len(combined_text)
+
+        requests.append(_ReplaceAllText(placeholder, combined_text))
+        if hyperlink:
+            requests.append(_UpdateTextStyle(object_id, index, combined_end, link=hyperlink, font_size=font_size))
+        elif font_size is not None:
+            requests.append(_UpdateTextStyle(object_id, index, combined_end, font_size=font_size))
+
+        if spacing_after is not None:
+            requests.append(_UpdateParagraphStyle(object_id, index, combined_end, spacing_after))
+
+        if option_title and replacement.strip():
+            # Bold the option title (first line)
+            requests.append(_UpdateTextStyle(object_id, index, index + len(option_title), bold=True, font_size=font_size))
+
+            # Apply bold styling for words marked with ** in the body
+            body_start_index = index + len(option_title) + 1
+            for r_start, r_end in bold_ranges_body:
+                requests.append(_UpdateTextStyle(object_id, body_start_index + r_start, body_start_index + r_end,
+                                                 bold=True, font_size=font_size))
+
+            # Apply list styling to the body (after title and newline)
+            requests.extend(self._create_list_style_requests(object_id, final_body, body_list_info, body_start_index))
+        else:
+            # Apply bold styling for words marked with ** in the entire replacement text
+            for r_start, r_end in bold_ranges:
+                requests.append(_UpdateTextStyle(object_id, index + r_start, index + r_end,
+                                                 bold=True, font_size=font_size))
+
+            # Apply list styling to the entire replacement text
+            requests.extend(self._create_list_style_requests(object_id, final_text, list_info, index))
         return requests
 
     def _format_lists(self, text):
@@ -270,30 +362,9 @@ class Presentation:
 
         for i, line in enumerate(lines):
             line_length = len(line) + 1  # +1 for newline character
-            if list_info[i] == 'numbered':
-                requests.append({
-                    'createParagraphBullets': {
-                        'objectId': object_id,
-                        'textRange': {
-                            'type': 'FIXED_RANGE',
-                            'startIndex': current_index,
-                            'endIndex': current_index + line_length
-                        },
-                        'bulletPreset': 'NUMBERED_DIGIT_ALPHA_ROMAN'
-                    }
-                })
-            elif list_info[i] == 'bullet':
-                requests.append({
-                    'createParagraphBullets': {
-                        'objectId': object_id,
-                        'textRange': {
-                            'type': 'FIXED_RANGE',
-                            'startIndex': current_index,
-                            'endIndex': current_index + line_length
-                        },
-                        'bulletPreset': 'BULLET_DISC_CIRCLE_SQUARE'
-                    }
-                })
+            preset = _BULLET_PRESETS.get(list_info[i])
+            if preset is not None:
+                requests.append(_CreateParagraphBullets(object_id, current_index, current_index + line_length, preset))
             current_index += line_length
 
         return requests
@@ -305,6 +376,7 @@ class Presentation:
         If an option_title is provided (and replacement is non-empty) the inserted text will have
         its first line set to option_title and formatted to be bold.
         Handles formatting for numbered lists and bullet points in both slides and speaker notes.
+        In plan mode the text is read from the plan's snapshot instead of being fetched.
 
         Args:
             placeholder (str): The text to replace.
@@ -315,31 +387,13 @@ class Presentation:
             font_size (int, optional): Font size in points. Defaults to None.
             spacing_after (float, optional): Space after paragraph in points. Defaults to None.
         """
-        presentation = self.fetch()
         requests = []
-        for slide in presentation.get('slides', []):
-            slide_requests = []
-            
-            # Replace text in slide content
-            for element in slide.get('pageElements', []):
-                reqs = self._build_requests_for_element(
-                            element, placeholder, replacement, hyperlink,
-                            is_notes=False, option_title=option_title,
-                            font_size=font_size, spacing_after=spacing_after)
-                slide_requests.extend(reqs)
-            
-            # Replace text in speaker notes
-            if 'slideProperties' in slide and 'notesPage' in slide['slideProperties']:
-                notes_page = slide['slideProperties']['notesPage']
-                for element in notes_page.get('pageElements', []):
-                    if 'shape' in element and 'text' in element['shape']:
-                        reqs = self._build_requests_for_element(
-                                    element, placeholder, replacement, hyperlink,
-                                    is_notes=True, option_title=option_title,
-                                    font_size=font_size, spacing_after=spacing_after)
-                        slide_requests.extend(reqs)
-            
-            requests.extend(slide_requests)
+        elements = self.plan.text_elements() if self.plan is not None else self._fetch_text_elements()
+        for element in elements:
+            requests.extend(self._build_requests_for_element(
+                element, placeholder, replacement, hyperlink,
+                option_title=option_title, font_size=font_size,
+                spacing_after=spacing_after))
 
         if requests:
             self.batch_update(requests)
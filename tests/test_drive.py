@@ -0,0 +1,122 @@
+import itertools
+import re
+
+from pygoogleslides.drive import sync_folder_tree
+
+FOLDER = 'application/vnd.google-apps.folder'
+
+
+class _Call:
+    def __init__(self, func):
+        self.func = func
+
+    def execute(self):
+        return self.func()
+
+
+class _Batch:
+    def __init__(self, callback):
+        self.callback = callback
+        self.calls = []
+
+    def add(self, call, request_id):
+        self.calls.append((request_id, call))
+
+    def execute(self):
+        for request_id, call in self.calls:
+            try:
+                self.callback(request_id, call.execute(), None)
+            except Exception as e:
+                self.callback(request_id, None, e)
+
+
+class FakeDrive:
+    """In-memory stand-in for the parts of the Drive v3 service used by sync_folder_tree."""
+
+    def __init__(self):
+        self.items = {'ROOT': {'id': 'ROOT', 'name': 'My Drive', 'mimeType': FOLDER, 'parents': []}}
+        self._ids = itertools.count()
+
+    def add(self, name, parents, mime_type=FOLDER):
+        item_id = f'id{next(self._ids)}'
+        self.items[item_id] = {
+            'id': item_id,
+            'name': name,
+            'mimeType': mime_type,
+            'parents': list(parents),
+            'createdTime': f'{len(self.items):05d}',
+        }
+        return item_id
+
+    def paths(self):
+        def path_of(item):
+            parent = item['parents'][0]
+            return item['name'] if parent == 'ROOT' else path_of(self.items[parent]) + '/' + item['name']
+        return sorted(path_of(item) for item_id, item in self.items.items() if item_id != 'ROOT')
+
+    def files(self):
+        return self
+
+    def new_batch_http_request(self, callback):
+        return _Batch(callback)
+
+    def get(self, fileId, fields):
+        return _Call(lambda: {'id': 'ROOT' if fileId == 'root' else fileId})
+
+    def list(self, q, spaces, fields, pageSize, pageToken):
+        parents = set(re.findall(r"'(\w+)' in parents", q))
+        matches = [
+            dict(item) for item in self.items.values()
+            if parents & set(item['parents']) and ('mimeType' not in q or item['mimeType'] == FOLDER)
+        ]
+        return _Call(lambda: {'files': matches})
+
+    def update(self, fileId, addParents, removeParents, fields):
+        def move():
+            parents = self.items[fileId]['parents']
+            parents.remove(removeParents)
+            if addParents not in parents:
+                parents.append(addParents)
+            return {'id': fileId}
+        return _Call(move)
+
+    def delete(self, fileId):
+        def delete_tree():
+            # Like Drive, deleting a folder also deletes everything inside it
+            for item_id in [i for i, item in self.items.items() if item['parents'] == [fileId]]:
+                self.delete(item_id).execute()
+            del self.items[fileId]
+        return _Call(delete_tree)
+
+    def create(self, body, fields):
+        return _Call(lambda: {'id': self.add(body['name'], body['parents']), 'name': body['name']})
+
+
+def test_sync_folder_tree_creates_missing_and_merges_duplicates():
+    drive = FakeDrive()
+    first = drive.add('acme', ['ROOT'])
+    second = drive.add('acme', ['ROOT'])
+    drive.add('2024', [first])
+    year = drive.add('2024', [second])
+    drive.add('deck', [year], mime_type='presentation')
+
+    result = sync_folder_tree(drive, ['acme/2024/01', 'beta'])
+
+    assert drive.paths() == ['acme', 'acme/2024', 'acme/2024/01', 'acme/2024/deck', 'beta']
+    assert result['acme'] == first
+    assert sorted(result) == ['acme', 'acme/2024', 'acme/2024/01', 'beta']
+
+
+def test_sync_folder_tree_keeps_folder_with_several_parents():
+    drive = FakeDrive()
+    first = drive.add('A', ['ROOT'])
+    second = drive.add('A', ['ROOT'])
+    shared = drive.add('B', [first, second])
+    kept_file = drive.add('keep.txt', [shared], mime_type='text/plain')
+
+    result = sync_folder_tree(drive, ['A/B'])
+
+    assert result == {'A': first, 'A/B': shared}
+    assert shared in drive.items
+    assert kept_file in drive.items
+    assert second not in drive.items
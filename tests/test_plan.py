@@ -0,0 +1,53 @@
+from pygoogleslides.plan import RequestPlan, summarize_snapshot
+
+
+def _shape(object_id, text):
+    return {'objectId': object_id, 'shape': {'text': {'textElements': [{'textRun': {'content': text}}]}}}
+
+
+PRESENTATION = {
+    'presentationId': 'template',
+    'slides': [{
+        'objectId': 's1',
+        'pageElements': [_shape('title', 'Hello {{name}}\n')],
+        'slideProperties': {'notesPage': {'objectId': 'n1', 'pageElements': [_shape('notes', 'For {{name}}\n')]}},
+    }],
+    'layouts': [{'objectId': 'layout1'}],
+    'masters': [{'objectId': 'master1'}],
+}
+
+
+def _replace_all_text(page_object_ids):
+    return {'replaceAllText': {
+        'containsText': {'text': '{{name}}', 'matchCase': True},
+        'replaceText': 'Ada',
+        'pageObjectIds': page_object_ids,
+    }}
+
+
+def test_page_object_ids_accept_notes_layout_and_master_pages():
+    plan = RequestPlan(
+        requests=[_replace_all_text(['n1', 'layout1', 'master1'])],
+        snapshot=summarize_snapshot(PRESENTATION),
+    )
+
+    assert plan.problems() == []
+    assert {element.object_id: element.text for element in plan.text_elements()} == {
+        'title': 'Hello {{name}}\n',
+        'notes': 'For Ada\n',
+    }
+
+
+def test_unknown_page_object_id_is_reported():
+    plan = RequestPlan(requests=[_replace_all_text(['missing'])], snapshot=summarize_snapshot(PRESENTATION))
+
+    assert plan.problems() == ["Request 0 (replaceAllText): pageObjectId 'missing' does not exist"]
+
+
+def test_deleting_a_slide_forgets_its_notes_page():
+    plan = RequestPlan(
+        requests=[{'deleteObject': {'objectId': 's1'}}, _replace_all_text(['n1'])],
+        snapshot=summarize_snapshot(PRESENTATION),
+    )
+
+    assert plan.problems() == ["Request 1 (replaceAllText): pageObjectId 'n1' does not exist"]